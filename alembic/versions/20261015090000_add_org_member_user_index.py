@@ -0,0 +1,30 @@
+"""add organization member user index
+
+Revision ID: edcfca090c9d
+Revises: 4f8dfe7c3c12
+Create Date: 2026-10-15 09:00:00.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "edcfca090c9d"
+down_revision = "4f8dfe7c3c12"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Listing a user's organizations filters on user_id alone; the primary
+    # key leads with org_id so it cannot serve that lookup. Including org_id
+    # lets the join to organizations run as an index-only scan.
+    op.create_index(
+        "idx_org_member_user",
+        "organization_members",
+        ["user_id", "org_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_org_member_user", table_name="organization_members")
@@ -0,0 +1,69 @@
+"""use native uuid for organization ids
+
+Revision ID: ae9e4b7f6715
+Revises: edcfca090c9d
+Create Date: 2026-10-15 10:00:00.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ae9e4b7f6715"
+down_revision = "edcfca090c9d"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs holding organization ids; user identity columns stay
+# text because auth handlers may return non-UUID identities.
+ORG_ID_COLUMNS = (
+    ("organizations", "org_id"),
+    ("organization_members", "org_id"),
+    ("assistant", "org_id"),
+)
+
+
+def _drop_org_foreign_keys() -> None:
+    op.drop_constraint(
+        "organization_members_org_id_fkey", "organization_members", type_="foreignkey"
+    )
+    op.drop_constraint("assistant_org_id_fkey", "assistant", type_="foreignkey")
+
+
+def _create_org_foreign_keys() -> None:
+    op.create_foreign_key(
+        "organization_members_org_id_fkey",
+        "organization_members",
+        "organizations",
+        ["org_id"],
+        ["org_id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "assistant_org_id_fkey",
+        "assistant",
+        "organizations",
+        ["org_id"],
+        ["org_id"],
+        ondelete="SET NULL",
+    )
+
+
+def upgrade() -> None:
+    # 16-byte uuid instead of ~37-byte text shrinks the primary key, the
+    # foreign keys and every index that carries org_id. Indexes are rebuilt
+    # by ALTER TYPE; the foreign keys must be dropped while types differ.
+    _drop_org_foreign_keys()
+    for table, column in ORG_ID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+        )
+    _create_org_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_org_foreign_keys()
+    for table, column in ORG_ID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text USING {column}::text"
+        )
+    _create_org_foreign_keys()
@@ -0,0 +1,33 @@
+"""add partial index on organization admins
+
+Revision ID: 5b1d7c2e9a40
+Revises: ae9e4b7f6715
+Create Date: 2026-10-15 11:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b1d7c2e9a40"
+down_revision = "ae9e4b7f6715"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Admin checks probe (org_id, user_id) with role = 'admin'. Indexing only
+    # admin rows keeps the index small and answers the check without
+    # visiting the heap for the role.
+    op.create_index(
+        "idx_org_member_admin",
+        "organization_members",
+        ["org_id", "user_id"],
+        unique=False,
+        postgresql_where=sa.text("role = 'admin'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_org_member_admin", table_name="organization_members")
@@ -1,9 +1,17 @@
 """Routes for organization management."""
 
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+from uuid import UUID
+
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 
 from ..core.auth_deps import get_current_user
 from ..models import (
+    MembershipBulkCreate,
     MembershipCreate,
     MembershipUpdate,
     OrganizationCreate,
@@ -20,85 +28,146 @@ from ..services.organization_service import (
 router = APIRouter()
 
 
+def _orjson_response(content: BaseModel | Sequence[BaseModel]) -> Response:
+    """Encode service results with orjson, bypassing the response_model pass.
+
+    The service already returns the response models, so FastAPI re-validating
+    and converting them to JSON-safe dicts is redundant. Python-mode dumps keep
+    datetimes as objects for orjson to format natively; OPT_UTC_Z matches
+    pydantic's ``Z`` suffix.
+    """
+    payload: Any
+    if isinstance(content, BaseModel):
+        payload = content.model_dump()
+    else:
+        payload = [item.model_dump() for item in content]
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_UTC_Z),
+        media_type="application/json",
+    )
+
+
+async def _json_array(
+    batches: AsyncIterator[list[OrganizationMember]],
+) -> AsyncIterator[bytes]:
+    """Encode member batches as a single JSON array without buffering it."""
+    yield b"["
+    first = True
+    async for batch in batches:
+        if not batch:
+            continue
+        chunk = b",".join(
+            orjson.dumps(member.model_dump(), option=orjson.OPT_UTC_Z)
+            for member in batch
+        )
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
 @router.post("/organizations", response_model=OrganizationWithMembers)
 async def create_organization(
     request: OrganizationCreate,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> OrganizationWithMembers:
+) -> Response:
     """Create a new organization where the caller becomes admin."""
-    return await service.create_organization(request, user.identity)
+    return _orjson_response(await service.create_organization(request, user.identity))
 
 
 @router.get("/organizations", response_model=list[OrganizationView])
 async def list_organizations(
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> list[OrganizationView]:
+) -> Response:
     """List organizations the caller belongs to."""
-    return await service.list_organizations(user.identity)
+    return _orjson_response(await service.list_organizations(user.identity))
 
 
 @router.get("/organizations/{org_id}", response_model=OrganizationWithMembers)
 async def get_organization(
-    org_id: str,
+    org_id: UUID,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> OrganizationWithMembers:
+) -> Response:
     """Get organization details if the caller is a member."""
-    return await service.get_organization(org_id, user.identity)
+    organization = await service.get_organization(str(org_id), user.identity)
+    return _orjson_response(organization)
 
 
 @router.get("/organizations/{org_id}/members", response_model=list[OrganizationMember])
 async def list_members(
-    org_id: str,
+    org_id: UUID,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> list[OrganizationMember]:
+) -> Response:
     """List members of an organization (requires membership)."""
-    organization = await service.get_organization(org_id, user.identity)
-    return organization.members
+    members = await service.list_members(str(org_id), user.identity)
+    if members is None:
+        return StreamingResponse(
+            _json_array(service.stream_members(str(org_id))),
+            media_type="application/json",
+        )
+    return _orjson_response(members)
 
 
 @router.post("/organizations/{org_id}/members", response_model=OrganizationMember)
 async def add_member(
-    org_id: str,
+    org_id: UUID,
     request: MembershipCreate,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> OrganizationMember:
+) -> Response:
     """Add a member to the organization (admin only)."""
-    return await service.add_member(org_id, request, user.identity)
+    member = await service.add_member(str(org_id), request, user.identity)
+    return _orjson_response(member)
+
+
+@router.post(
+    "/organizations/{org_id}/members/bulk", response_model=list[OrganizationMember]
+)
+async def add_members(
+    org_id: UUID,
+    request: MembershipBulkCreate,
+    user: User = Depends(get_current_user),
+    service: OrganizationService = Depends(get_organization_service),
+) -> Response:
+    """Add several members at once (admin only); existing members are skipped."""
+    members = await service.add_members(str(org_id), request, user.identity)
+    return _orjson_response(members)
 
 
 @router.patch("/organizations/{org_id}/members/{member_id}", response_model=OrganizationMember)
 async def update_member(
-    org_id: str,
+    org_id: UUID,
     member_id: str,
     request: MembershipUpdate,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
-) -> OrganizationMember:
+) -> Response:
     """Update a member role (admin only)."""
-    return await service.update_member(org_id, member_id, request, user.identity)
+    member = await service.update_member(
+        str(org_id), member_id, request, user.identity
+    )
+    return _orjson_response(member)
 
 
 @router.delete("/organizations/{org_id}/members/{member_id}")
 async def remove_member(
-    org_id: str,
+    org_id: UUID,
     member_id: str,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
 ) -> None:
     """Remove a member from the organization (admin only)."""
-    return await service.remove_member(org_id, member_id, user.identity)
+    return await service.remove_member(str(org_id), member_id, user.identity)
 
 
 @router.delete("/organizations/{org_id}", status_code=204)
 async def delete_organization(
-    org_id: str,
+    org_id: UUID,
     user: User = Depends(get_current_user),
     service: OrganizationService = Depends(get_organization_service),
 ) -> None:
     """Delete an organization (admin only)."""
-    await service.delete_organization(org_id, user.identity)
+    await service.delete_organization(str(org_id), user.identity)
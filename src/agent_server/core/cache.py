@@ -0,0 +1,39 @@
+"""Optional Redis connection used for short-lived response caching.
+
+Caching is enabled only when ``REDIS_URL`` is set. Without it ``client`` stays
+``None`` and callers fall through to the database.
+"""
+
+import os
+
+import structlog
+from redis.asyncio import Redis
+
+logger = structlog.get_logger(__name__)
+
+
+class CacheManager:
+    """Manages the shared Redis client"""
+
+    def __init__(self) -> None:
+        self.client: Redis | None = None
+        self._redis_url = os.getenv("REDIS_URL")
+
+    async def initialize(self) -> None:
+        """Connect to Redis if configured"""
+        if not self._redis_url:
+            logger.info("REDIS_URL not set, response caching disabled")
+            return
+
+        self.client = Redis.from_url(self._redis_url, decode_responses=True)
+        logger.info("✅ Redis cache initialized")
+
+    async def close(self) -> None:
+        """Close the Redis connection"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+
+# Global cache manager instance
+cache_manager = CacheManager()
@@ -27,9 +27,15 @@ class DatabaseManager:
     async def initialize(self) -> None:
         """Initialize database connections and LangGraph components"""
         # SQLAlchemy for our minimal Agent Protocol metadata tables
+        # Keep warm connections around; pre_ping/recycle drop stale ones before
+        # a request hits them instead of failing mid-query
         self.engine = create_async_engine(
             self._database_url,
             echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
+            pool_size=int(os.getenv("DATABASE_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+            pool_pre_ping=True,
+            pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", "3600")),
         )
 
         # Convert asyncpg URL to psycopg format for LangGraph
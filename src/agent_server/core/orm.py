@@ -24,9 +24,9 @@ from sqlalchemy import (
     Text,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
 Base = declarative_base()
 
@@ -34,8 +34,9 @@ Base = declarative_base()
 class Organization(Base):
     __tablename__ = "organizations"
 
+    # Native uuid storage, exposed to Python as canonical strings
     org_id: Mapped[str] = mapped_column(
-        Text, primary_key=True, server_default=text("uuid_generate_v4()::text")
+        UUID(as_uuid=False), primary_key=True, server_default=text("uuid_generate_v4()")
     )
     name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
     created_by: Mapped[str] = mapped_column(Text, nullable=False)
@@ -46,6 +47,15 @@ class Organization(Base):
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
 
+    # Never lazy-load under asyncio; callers must opt in with selectinload().
+    # Member rows are removed by the FK's ON DELETE CASCADE.
+    members: Mapped[list[OrganizationMember]] = relationship(
+        "OrganizationMember",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
     __table_args__ = (Index("idx_organizations_name", "name", unique=True),)
 
 
@@ -53,7 +63,9 @@ class OrganizationMember(Base):
     __tablename__ = "organization_members"
 
     org_id: Mapped[str] = mapped_column(
-        Text, ForeignKey("organizations.org_id", ondelete="CASCADE"), primary_key=True
+        UUID(as_uuid=False),
+        ForeignKey("organizations.org_id", ondelete="CASCADE"),
+        primary_key=True,
     )
     user_id: Mapped[str] = mapped_column(Text, primary_key=True)
     role: Mapped[str] = mapped_column(Text, nullable=False)
@@ -62,7 +74,16 @@ class OrganizationMember(Base):
         TIMESTAMP(timezone=True), server_default=text("now()")
     )
 
-    __table_args__ = (Index("idx_org_member_role", "org_id", "role"),)
+    __table_args__ = (
+        Index("idx_org_member_role", "org_id", "role"),
+        Index("idx_org_member_user", "user_id", "org_id"),
+        Index(
+            "idx_org_member_admin",
+            "org_id",
+            "user_id",
+            postgresql_where=text("role = 'admin'"),
+        ),
+    )
 
 
 class Assistant(Base):
@@ -79,7 +100,9 @@ class Assistant(Base):
     context: Mapped[dict] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
     user_id: Mapped[str] = mapped_column(Text, nullable=False)
     org_id: Mapped[str | None] = mapped_column(
-        Text, ForeignKey("organizations.org_id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("organizations.org_id", ondelete="SET NULL"),
+        nullable=True,
     )
     version: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default=text("1")
@@ -37,6 +37,7 @@ from .api.threads import router as threads_router
 from .config import HttpConfig, load_http_config
 from .core.app_loader import load_custom_app
 from .core.auth_middleware import get_auth_backend, on_auth_error
+from .core.cache import cache_manager
 from .core.database import db_manager
 from .core.health import router as health_router
 from .core.route_merger import (
@@ -65,6 +66,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     """FastAPI lifespan context manager for startup/shutdown"""
     # Startup: Initialize database and LangGraph components
     await db_manager.initialize()
+    await cache_manager.initialize()
 
     # Initialize observability providers
     observability_manager = get_observability_manager()
@@ -87,6 +89,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     # Stop event store cleanup task
     await event_store.stop_cleanup_task()
 
+    await cache_manager.close()
     await db_manager.close()
 
 
@@ -10,6 +10,7 @@ from .assistants import (
 )
 from .auth import AuthContext, TokenPayload, User
 from .organizations import (
+    MembershipBulkCreate,
     MembershipCreate,
     MembershipUpdate,
     Organization,
@@ -87,5 +88,6 @@ __all__ = [
     "OrganizationMember",
     "OrganizationView",
     "MembershipCreate",
+    "MembershipBulkCreate",
     "MembershipUpdate",
 ]
@@ -58,3 +58,19 @@ class MembershipCreate(BaseModel):
 
     user_id: str = Field(..., description="User to add")
     role: str = Field(..., description="Role for the user (admin/staff)")
+
+
+# Upper bound for one bulk request (ten INSERT batches); the whole request
+# runs in a single transaction, so larger imports must be split by the client
+MAX_BULK_MEMBERS = 10_000
+
+
+class MembershipBulkCreate(BaseModel):
+    """Add several members to an organization at once."""
+
+    members: list[MembershipCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_MEMBERS,
+        description="Users to add; existing members are skipped",
+    )
@@ -0,0 +1,219 @@
+"""Redis cache for organization read endpoints."""
+
+import os
+from collections.abc import Iterable
+from typing import cast
+
+import structlog
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..models import OrganizationView, OrganizationWithMembers
+
+logger = structlog.get_logger(__name__)
+
+CACHE_TTL_SECONDS = int(os.getenv("ORG_CACHE_TTL", "30"))
+ROLE_CACHE_TTL_SECONDS = int(os.getenv("ORG_ROLE_CACHE_TTL", "10"))
+# Outlives any in-flight request so an expired counter cannot resurrect an
+# old generation a slow writer still holds
+GENERATION_TTL_SECONDS = 86400
+
+# Writes only if the organization's generation still matches the one read
+# before the database query, so data loaded before an invalidation is dropped.
+# The TTL check stands in for EXPIRE NX (Redis 7+): it keeps the first
+# deadline so no field outlives the TTL, and works on older servers.
+# KEYS: generation, hash. ARGV: generation, field, value, ttl.
+_HSET_IF_GENERATION = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[2], ARGV[3])
+if redis.call('TTL', KEYS[2]) < 0 then
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+return 1
+"""
+
+# Same guard for plain values. KEYS: generation, key. ARGV: generation, value, ttl.
+_SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+_organization_list = TypeAdapter(list[OrganizationView])
+
+
+def _list_key(user_id: str) -> str:
+    return f"org:list:{user_id}"
+
+
+def _detail_key(org_id: str) -> str:
+    return f"org:detail:{org_id}"
+
+
+def _roles_key(org_id: str) -> str:
+    return f"org_roles:{org_id}"
+
+
+def _generation_key(org_id: str) -> str:
+    return f"org:gen:{org_id}"
+
+
+def _list_generation_key(user_id: str) -> str:
+    return f"org:list_gen:{user_id}"
+
+
+class OrganizationCache:
+    """Short-lived cache of organization responses.
+
+    Listings are keyed by the requesting user. Details hold nothing per-user,
+    so each organization has one shared payload; callers must authorize
+    every read against its member list. Confirmed admin roles are kept in a
+    per-organization hash with a shorter TTL. Redis failures are logged and
+    treated as cache misses.
+
+    Each organization, and each user's listing, has a generation counter
+    that ``invalidate`` bumps. Writers read it with ``generation`` or
+    ``list_generation`` before querying the database and pass it back, so a
+    write racing an invalidation is discarded instead of reviving stale data.
+    """
+
+    __slots__ = ("client", "ttl", "role_ttl")
+
+    def __init__(
+        self,
+        client: Redis | None,
+        ttl: int = CACHE_TTL_SECONDS,
+        role_ttl: int = ROLE_CACHE_TTL_SECONDS,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.role_ttl = role_ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    async def get_organizations(self, user_id: str) -> list[OrganizationView] | None:
+        if self.client is None:
+            return None
+        try:
+            cached = await self.client.get(_list_key(user_id))
+        except RedisError as e:
+            logger.warning("Organization cache read failed", error=str(e))
+            return None
+        return _organization_list.validate_json(cached) if cached else None
+
+    async def set_organizations(
+        self, user_id: str, organizations: list[OrganizationView], generation: str
+    ) -> None:
+        if self.client is None:
+            return
+        script = self.client.register_script(_SET_IF_GENERATION)
+        try:
+            await script(
+                keys=[_list_generation_key(user_id), _list_key(user_id)],
+                args=[
+                    generation,
+                    _organization_list.dump_json(organizations),
+                    self.ttl,
+                ],
+            )
+        except RedisError as e:
+            logger.warning("Organization cache write failed", error=str(e))
+
+    async def get_organization(self, org_id: str) -> OrganizationWithMembers | None:
+        """Return the shared detail payload; the caller must check membership."""
+        if self.client is None:
+            return None
+        try:
+            cached = await self.client.get(_detail_key(org_id))
+        except RedisError as e:
+            logger.warning("Organization cache read failed", error=str(e))
+            return None
+        return OrganizationWithMembers.model_validate_json(cached) if cached else None
+
+    async def set_organization(
+        self, org_id: str, organization: OrganizationWithMembers, generation: str
+    ) -> None:
+        if self.client is None:
+            return
+        script = self.client.register_script(_SET_IF_GENERATION)
+        try:
+            await script(
+                keys=[_generation_key(org_id), _detail_key(org_id)],
+                args=[generation, organization.model_dump_json(), self.ttl],
+            )
+        except RedisError as e:
+            logger.warning("Organization cache write failed", error=str(e))
+
+    async def _read_generation(self, key: str) -> str:
+        if self.client is None:
+            return "0"
+        try:
+            # The client decodes responses, so values come back as str
+            return cast("str | None", await self.client.get(key)) or "0"
+        except RedisError as e:
+            logger.warning("Organization cache read failed", error=str(e))
+            return "0"
+
+    async def generation(self, org_id: str) -> str:
+        """Current generation for ``org_id``; read it before loading data to cache."""
+        return await self._read_generation(_generation_key(org_id))
+
+    async def list_generation(self, user_id: str) -> str:
+        """Current generation for ``user_id``'s listing; read it before the query."""
+        return await self._read_generation(_list_generation_key(user_id))
+
+    async def get_role(self, org_id: str, user_id: str) -> str | None:
+        if self.client is None:
+            return None
+        try:
+            return cast("str | None", await self.client.hget(_roles_key(org_id), user_id))
+        except RedisError as e:
+            logger.warning("Organization role cache read failed", error=str(e))
+            return None
+
+    async def set_role(
+        self, org_id: str, user_id: str, role: str, generation: str
+    ) -> None:
+        if self.client is None:
+            return
+        script = self.client.register_script(_HSET_IF_GENERATION)
+        try:
+            await script(
+                keys=[_generation_key(org_id), _roles_key(org_id)],
+                args=[generation, user_id, role, self.role_ttl],
+            )
+        except RedisError as e:
+            logger.warning("Organization role cache write failed", error=str(e))
+
+    async def invalidate(
+        self, org_id: str | None = None, user_ids: Iterable[str] = ()
+    ) -> None:
+        """Drop cached details and roles for ``org_id`` and the listings of ``user_ids``."""
+        if self.client is None:
+            return
+        user_ids = list(user_ids)
+        keys = [_list_key(user_id) for user_id in user_ids]
+        generation_keys = [_list_generation_key(user_id) for user_id in user_ids]
+        if org_id is not None:
+            keys.extend((_detail_key(org_id), _roles_key(org_id)))
+            generation_keys.append(_generation_key(org_id))
+        if not keys:
+            return
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                # Bump first: a guarded write landing after this is rejected,
+                # one landing before it is deleted below
+                for key in generation_keys:
+                    pipe.incr(key)
+                    pipe.expire(key, GENERATION_TTL_SECONDS)
+                pipe.delete(*keys)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Organization cache invalidation failed", error=str(e))
@@ -1,176 +1,398 @@
 """Service layer for organization management."""
 """Business logic for organizations and membership."""
 
-from uuid import uuid4
+from collections.abc import AsyncIterator
+from typing import Any, cast
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import (
+    delete,
+    exists,
+    func,
+    lambda_stmt,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from ..core.cache import cache_manager
 from ..core.orm import Organization as OrganizationORM
 from ..core.orm import OrganizationMember as OrganizationMemberORM
-from ..core.orm import get_session
+from ..core.orm import _get_session_maker, get_session
 from ..models import (
+    MembershipBulkCreate,
     MembershipCreate,
     MembershipUpdate,
-    Organization,
     OrganizationCreate,
     OrganizationMember,
     OrganizationView,
     OrganizationWithMembers,
 )
+from ..utils.ids import uuid7
+from .organization_cache import OrganizationCache
+
+# Rows per multi-VALUES INSERT; larger batches stop paying off on PostgreSQL
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Member listings above this size are streamed instead of buffered
+MEMBER_STREAM_THRESHOLD = 1000
+MEMBER_STREAM_BATCH_SIZE = 500
+
+
+def _organization_fields(row: OrganizationORM) -> dict:
+    return {
+        "org_id": row.org_id,
+        "name": row.name,
+        "created_by": row.created_by,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _require_cached_member(organization: OrganizationWithMembers, user_id: str) -> None:
+    """Authorize a read of the shared cached detail.
+
+    The member list is cached under the same generation as the rest of the
+    payload, so it is exactly as fresh as the data it guards.
+    """
+    if not any(member.user_id == user_id for member in organization.members):
+        raise HTTPException(status_code=403, detail="Not a member of this organization")
+
+
+def _member_to_pydantic(row: OrganizationMemberORM) -> OrganizationMember:
+    """Build a membership model from a DB row.
+
+    Rows come straight from the database and already match the schema, so
+    ``model_construct`` skips the redundant validation pass.
+    """
+    return OrganizationMember.model_construct(
+        org_id=row.org_id,
+        user_id=row.user_id,
+        role=row.role,
+        invited_by=row.invited_by,
+        created_at=row.created_at,
+    )
 
 
 class OrganizationService:
-    """Encapsulates organization business logic."""
+    """Encapsulates organization business logic.
+
+    Hot read paths use ``lambda_stmt`` so SQLAlchemy caches the constructed
+    statement by lambda identity; closure variables become bound parameters.
+    """
 
-    def __init__(self, session: AsyncSession):
+    # Built for every request; slots skip the per-instance __dict__
+    __slots__ = ("session", "cache")
+
+    def __init__(self, session: AsyncSession, cache: OrganizationCache | None = None):
         self.session = session
+        self.cache = cache or OrganizationCache(None)
 
-    async def _get_membership(self, org_id: str, user_id: str) -> OrganizationMemberORM | None:
-        stmt = select(OrganizationMemberORM).where(
-            OrganizationMemberORM.org_id == org_id,
-            OrganizationMemberORM.user_id == user_id,
+    async def _is_admin(self, org_id: str, user_id: str) -> bool:
+        # The role is inlined as a literal so the predicate matches the
+        # idx_org_member_admin partial index even under generic prepared
+        # plans; the probe is then an index-only scan of admin rows.
+        stmt = lambda_stmt(
+            lambda: select(
+                exists().where(
+                    OrganizationMemberORM.org_id == org_id,
+                    OrganizationMemberORM.user_id == user_id,
+                    OrganizationMemberORM.role == literal_column("'admin'"),
+                )
+            )
         )
-        return await self.session.scalar(stmt)
+        return bool(await self.session.scalar(stmt))
 
-    async def _require_admin(self, org_id: str, user_id: str) -> OrganizationMemberORM:
-        membership = await self._get_membership(org_id, user_id)
-        if membership is None or membership.role != "admin":
+    async def _require_admin(self, org_id: str, user_id: str) -> None:
+        if await self.cache.get_role(org_id, user_id) == "admin":
+            return
+        generation = await self.cache.generation(org_id)
+        if not await self._is_admin(org_id, user_id):
             raise HTTPException(status_code=403, detail="Admin access required")
-        return membership
+        await self.cache.set_role(org_id, user_id, "admin", generation)
 
     async def create_organization(
         self, request: OrganizationCreate, creator_id: str
     ) -> OrganizationWithMembers:
-        existing = await self.session.scalar(
-            select(OrganizationORM).where(OrganizationORM.name == request.name)
+        # RETURNING hands back server defaults (timestamps) without a refresh;
+        # a name clash returns no row instead of racing a separate lookup
+        org = await self.session.scalar(
+            pg_insert(OrganizationORM)
+            .values(org_id=str(uuid7()), name=request.name, created_by=creator_id)
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(OrganizationORM)
         )
-        if existing:
+        if org is None:
             raise HTTPException(status_code=409, detail="Organization name already used")
 
-        org = OrganizationORM(
-            org_id=str(uuid4()),
-            name=request.name,
-            created_by=creator_id,
-        )
-        self.session.add(org)
-
-        membership = OrganizationMemberORM(
-            org_id=org.org_id,
-            user_id=creator_id,
-            role="admin",
-            invited_by=creator_id,
-        )
-        self.session.add(membership)
+        membership = (
+            await self.session.execute(
+                pg_insert(OrganizationMemberORM)
+                .values(
+                    org_id=org.org_id,
+                    user_id=creator_id,
+                    role="admin",
+                    invited_by=creator_id,
+                )
+                .returning(OrganizationMemberORM)
+            )
+        ).scalar_one()
         await self.session.commit()
+        await self.cache.invalidate(user_ids=[creator_id])
 
-        await self.session.refresh(org)
-        await self.session.refresh(membership)
-
-        return OrganizationWithMembers(
-            **Organization.model_validate(org, from_attributes=True).model_dump(),
-            members=[OrganizationMember.model_validate(membership, from_attributes=True)],
+        return OrganizationWithMembers.model_construct(
+            **_organization_fields(org),
+            members=[_member_to_pydantic(membership)],
         )
 
     async def list_organizations(self, user_id: str) -> list[OrganizationView]:
-        memberships = await self.session.scalars(
-            select(OrganizationMemberORM).where(OrganizationMemberORM.user_id == user_id)
-        )
-        memberships = memberships.all()
-        if not memberships:
-            return []
+        cached = await self.cache.get_organizations(user_id)
+        if cached is not None:
+            return cached
 
-        org_ids = [m.org_id for m in memberships]
-        organizations = await self.session.scalars(
-            select(OrganizationORM).where(OrganizationORM.org_id.in_(org_ids))
-        )
-        org_map = {org.org_id: org for org in organizations.all()}
-        return [
-            OrganizationView(
-                **Organization.model_validate(org_map[m.org_id], from_attributes=True).model_dump(),
-                role=m.role,
+        generation = await self.cache.list_generation(user_id)
+
+        # Plain columns named after the view's fields: each row maps straight
+        # onto the model without hydrating an ORM entity first
+        rows = await self.session.execute(
+            lambda_stmt(
+                lambda: select(
+                    OrganizationORM.org_id,
+                    OrganizationORM.name,
+                    OrganizationORM.created_by,
+                    OrganizationORM.created_at,
+                    OrganizationORM.updated_at,
+                    OrganizationMemberORM.role,
+                )
+                .join(
+                    OrganizationMemberORM,
+                    OrganizationMemberORM.org_id == OrganizationORM.org_id,
+                )
+                .where(OrganizationMemberORM.user_id == user_id)
             )
-            for m in memberships
-            if m.org_id in org_map
+        )
+        organizations = [
+            OrganizationView.model_construct(**row) for row in rows.mappings()
         ]
+        await self.cache.set_organizations(user_id, organizations, generation)
+        return organizations
 
-    async def get_organization(self, org_id: str, user_id: str) -> OrganizationWithMembers:
-        membership = await self._get_membership(org_id, user_id)
-        if membership is None:
+    async def _get_organization_with_members(
+        self, org_id: str, user_id: str
+    ) -> OrganizationORM:
+        """Load an organization and its members, requiring the caller to be one."""
+        org: OrganizationORM | None = await self.session.scalar(
+            lambda_stmt(
+                lambda: select(OrganizationORM)
+                .options(selectinload(OrganizationORM.members))
+                .where(OrganizationORM.org_id == org_id)
+            )
+        )
+        if org is None or not any(m.user_id == user_id for m in org.members):
             raise HTTPException(status_code=403, detail="Not a member of this organization")
+        return org
 
-        org = await self.session.get(OrganizationORM, org_id)
-        if org is None:
-            raise HTTPException(status_code=404, detail="Organization not found")
+    async def get_organization(self, org_id: str, user_id: str) -> OrganizationWithMembers:
+        cached = await self.cache.get_organization(org_id)
+        if cached is not None:
+            _require_cached_member(cached, user_id)
+            return cached
 
-        members = await self.session.scalars(
-            select(OrganizationMemberORM).where(OrganizationMemberORM.org_id == org_id)
+        generation = await self.cache.generation(org_id)
+        org = await self._get_organization_with_members(org_id, user_id)
+        organization = OrganizationWithMembers.model_construct(
+            **_organization_fields(org),
+            members=[_member_to_pydantic(member) for member in org.members],
         )
-        return OrganizationWithMembers(
-            **Organization.model_validate(org, from_attributes=True).model_dump(),
-            members=[
-                OrganizationMember.model_validate(member, from_attributes=True)
-                for member in members.all()
-            ],
+        # Large member lists would crowd everything else out of Redis
+        if len(organization.members) <= MEMBER_STREAM_THRESHOLD:
+            await self.cache.set_organization(org_id, organization, generation)
+        return organization
+
+    async def list_members(
+        self, org_id: str, user_id: str
+    ) -> list[OrganizationMember] | None:
+        """List members, or return None if there are too many to buffer.
+
+        Callers fall back to ``stream_members`` when this returns None.
+        """
+        cached = await self.cache.get_organization(org_id)
+        if cached is not None:
+            _require_cached_member(cached, user_id)
+            if len(cached.members) > MEMBER_STREAM_THRESHOLD:
+                return None
+            return cached.members
+
+        # Membership check and size probe in one round-trip
+        count, is_member = (
+            await self.session.execute(
+                lambda_stmt(
+                    lambda: select(
+                        func.count(),
+                        func.bool_or(OrganizationMemberORM.user_id == user_id),
+                    ).where(OrganizationMemberORM.org_id == org_id)
+                )
+            )
+        ).one()
+        if not is_member:
+            raise HTTPException(status_code=403, detail="Not a member of this organization")
+        if count > MEMBER_STREAM_THRESHOLD:
+            return None
+
+        members = await self.session.scalars(
+            lambda_stmt(
+                lambda: select(OrganizationMemberORM).where(
+                    OrganizationMemberORM.org_id == org_id
+                )
+            )
         )
+        return [_member_to_pydantic(member) for member in members.all()]
+
+    async def stream_members(
+        self, org_id: str
+    ) -> AsyncIterator[list[OrganizationMember]]:
+        """Yield members in batches using a server-side cursor.
+
+        Callers must have checked membership. This runs while the response body
+        is sent, after the request-scoped session is closed, so it uses its own.
+        """
+        maker = _get_session_maker()
+        async with maker() as session:
+            result = await session.stream_scalars(
+                select(OrganizationMemberORM)
+                .where(OrganizationMemberORM.org_id == org_id)
+                .execution_options(yield_per=MEMBER_STREAM_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                yield [_member_to_pydantic(member) for member in batch]
 
     async def add_member(
         self, org_id: str, request: MembershipCreate, acting_user_id: str
     ) -> OrganizationMember:
         await self._require_admin(org_id, acting_user_id)
 
-        target_membership = await self._get_membership(org_id, request.user_id)
-        if target_membership:
+        member = await self.session.scalar(
+            pg_insert(OrganizationMemberORM)
+            .values(
+                org_id=org_id,
+                user_id=request.user_id,
+                role=request.role,
+                invited_by=acting_user_id,
+            )
+            .on_conflict_do_nothing(index_elements=["org_id", "user_id"])
+            .returning(OrganizationMemberORM)
+        )
+        if member is None:
             raise HTTPException(status_code=409, detail="User already in organization")
+        await self.session.commit()
+        await self.cache.invalidate(org_id, [request.user_id])
+        return _member_to_pydantic(member)
 
-        member = OrganizationMemberORM(
-            org_id=org_id,
-            user_id=request.user_id,
-            role=request.role,
-            invited_by=acting_user_id,
-        )
-        self.session.add(member)
+    async def add_members(
+        self, org_id: str, request: MembershipBulkCreate, acting_user_id: str
+    ) -> list[OrganizationMember]:
+        """Add many members in batched INSERTs, skipping users already present."""
+        await self._require_admin(org_id, acting_user_id)
+
+        rows = [
+            {
+                "org_id": org_id,
+                "user_id": item.user_id,
+                "role": item.role,
+                "invited_by": acting_user_id,
+            }
+            for item in request.members
+        ]
+        added: list[OrganizationMemberORM] = []
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            stmt = (
+                pg_insert(OrganizationMemberORM)
+                .values(rows[start : start + BULK_INSERT_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["org_id", "user_id"])
+                .returning(OrganizationMemberORM)
+            )
+            result = await self.session.scalars(stmt)
+            added.extend(result.all())
         await self.session.commit()
-        await self.session.refresh(member)
-        return OrganizationMember.model_validate(member, from_attributes=True)
+
+        await self.cache.invalidate(org_id, [m.user_id for m in added])
+        return [_member_to_pydantic(member) for member in added]
 
     async def update_member(
         self, org_id: str, user_id: str, request: MembershipUpdate, acting_user_id: str
     ) -> OrganizationMember:
         await self._require_admin(org_id, acting_user_id)
-        membership = await self._get_membership(org_id, user_id)
+        membership = await self.session.scalar(
+            update(OrganizationMemberORM)
+            .where(
+                OrganizationMemberORM.org_id == org_id,
+                OrganizationMemberORM.user_id == user_id,
+            )
+            .values(role=request.role)
+            .returning(OrganizationMemberORM)
+        )
         if membership is None:
             raise HTTPException(status_code=404, detail="Member not found")
 
-        membership.role = request.role
         await self.session.commit()
-        await self.session.refresh(membership)
-        return OrganizationMember.model_validate(membership, from_attributes=True)
+        await self.cache.invalidate(org_id, [user_id])
+        return _member_to_pydantic(membership)
 
     async def remove_member(
         self, org_id: str, user_id: str, acting_user_id: str
     ) -> None:
         await self._require_admin(org_id, acting_user_id)
-        membership = await self._get_membership(org_id, user_id)
-        if membership is None:
+        result = cast(
+            "CursorResult[Any]",
+            await self.session.execute(
+                delete(OrganizationMemberORM).where(
+                    OrganizationMemberORM.org_id == org_id,
+                    OrganizationMemberORM.user_id == user_id,
+                )
+            ),
+        )
+        if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Member not found")
-        await self.session.delete(membership)
         await self.session.commit()
+        await self.cache.invalidate(org_id, [user_id])
 
     async def delete_organization(self, org_id: str, acting_user_id: str) -> None:
         """Delete an organization (admin only)."""
-        org = await self.session.get(OrganizationORM, org_id)
-        if org is None:
-            raise HTTPException(status_code=404, detail="Organization not found")
-
         await self._require_admin(org_id, acting_user_id)
 
-        await self.session.delete(org)
+        # Every member's cached listing goes stale, so collect them first
+        member_ids: list[str] = []
+        if self.cache.enabled:
+            member_ids = list(
+                await self.session.scalars(
+                    lambda_stmt(
+                        lambda: select(OrganizationMemberORM.user_id).where(
+                            OrganizationMemberORM.org_id == org_id
+                        )
+                    )
+                )
+            )
+
+        # Memberships go with it via ON DELETE CASCADE
+        result = cast(
+            "CursorResult[Any]",
+            await self.session.execute(
+                delete(OrganizationORM).where(OrganizationORM.org_id == org_id)
+            ),
+        )
+        if result.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Organization not found")
         await self.session.commit()
+        await self.cache.invalidate(org_id, member_ids)
 
 
+# Kept async: FastAPI runs sync dependencies in its threadpool, which costs
+# more than awaiting a coroutine that never suspends.
 async def get_organization_service(
     session: AsyncSession = Depends(get_session),
 ) -> OrganizationService:
-    return OrganizationService(session)
+    return OrganizationService(session, OrganizationCache(cache_manager.client))
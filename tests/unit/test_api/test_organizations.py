@@ -0,0 +1,248 @@
+"""Unit tests for organization routes
+
+The service is replaced through dependency overrides; these tests cover
+response encoding and the streaming fallback.
+"""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from agent_server.api.organizations import _json_array, list_members, router
+from agent_server.core.auth_deps import get_current_user
+from agent_server.models import (
+    MembershipBulkCreate,
+    MembershipCreate,
+    OrganizationMember,
+    OrganizationView,
+    OrganizationWithMembers,
+    User,
+)
+from agent_server.models.organizations import MAX_BULK_MEMBERS
+from agent_server.services.organization_service import (
+    OrganizationService,
+    get_organization_service,
+)
+
+ORG_ID = "0192f5d2-1c2a-7b3e-8a1d-1234567890ab"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_member(user_id: str, role: str = "staff") -> OrganizationMember:
+    return OrganizationMember.model_construct(
+        org_id=ORG_ID,
+        user_id=user_id,
+        role=role,
+        invited_by="admin-user",
+        created_at=NOW,
+    )
+
+
+def member_json(user_id: str, role: str = "staff") -> dict:
+    return {
+        "org_id": ORG_ID,
+        "user_id": user_id,
+        "role": role,
+        "invited_by": "admin-user",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+async def batches_of(*batches):
+    for batch in batches:
+        yield batch
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.fixture
+def mock_service():
+    """Mock OrganizationService for route tests"""
+    return AsyncMock(spec=OrganizationService)
+
+
+@pytest.fixture
+def client(mock_service):
+    """TestClient for the organization router with auth and service overridden"""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: User(identity="admin-user")
+    app.dependency_overrides[get_organization_service] = lambda: mock_service
+    return TestClient(app)
+
+
+class TestResponseEncoding:
+    """Test the exact bytes produced by the orjson response path"""
+
+    def test_list_organizations_body(self, client, mock_service):
+        """List responses match pydantic's JSON, including the Z suffix"""
+        mock_service.list_organizations.return_value = [
+            OrganizationView.model_construct(
+                org_id=ORG_ID,
+                name="Acme",
+                created_by="admin-user",
+                created_at=NOW,
+                updated_at=NOW,
+                role="admin",
+            )
+        ]
+
+        response = client.get("/organizations")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == (
+            b'[{"org_id":"0192f5d2-1c2a-7b3e-8a1d-1234567890ab","name":"Acme",'
+            b'"created_by":"admin-user","created_at":"2025-01-01T00:00:00Z",'
+            b'"updated_at":"2025-01-01T00:00:00Z","role":"admin"}]'
+        )
+
+    def test_get_organization_body(self, client, mock_service):
+        """Detail responses nest members with the same datetime format"""
+        mock_service.get_organization.return_value = (
+            OrganizationWithMembers.model_construct(
+                org_id=ORG_ID,
+                name="Acme",
+                created_by="admin-user",
+                created_at=NOW,
+                updated_at=NOW,
+                members=[make_member("admin-user", "admin")],
+            )
+        )
+
+        response = client.get(f"/organizations/{ORG_ID}")
+
+        assert response.status_code == 200
+        assert response.content == (
+            b'{"org_id":"0192f5d2-1c2a-7b3e-8a1d-1234567890ab","name":"Acme",'
+            b'"created_by":"admin-user","created_at":"2025-01-01T00:00:00Z",'
+            b'"updated_at":"2025-01-01T00:00:00Z","members":[{"org_id":'
+            b'"0192f5d2-1c2a-7b3e-8a1d-1234567890ab","user_id":"admin-user",'
+            b'"role":"admin","invited_by":"admin-user",'
+            b'"created_at":"2025-01-01T00:00:00Z"}]}'
+        )
+        mock_service.get_organization.assert_awaited_once_with(ORG_ID, "admin-user")
+
+    def test_matches_pydantic_serialization(self, client, mock_service):
+        """The orjson body is byte-identical to pydantic's own encoding"""
+        member = make_member("admin-user", "admin")
+        mock_service.list_members.return_value = [member]
+
+        response = client.get(f"/organizations/{ORG_ID}/members")
+
+        assert response.content == b"[" + member.model_dump_json().encode() + b"]"
+
+
+class TestJsonArray:
+    """Test incremental JSON array encoding of member batches"""
+
+    @pytest.mark.asyncio
+    async def test_no_members(self):
+        """A stream without members encodes as an empty array"""
+        assert await collect(_json_array(batches_of())) == b"[]"
+        assert await collect(_json_array(batches_of([], []))) == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_leading_empty_batch(self):
+        """An empty first batch does not produce a leading comma"""
+        body = await collect(_json_array(batches_of([], [make_member("a")])))
+
+        assert body.startswith(b"[{")
+        assert json.loads(body) == [member_json("a")]
+
+    @pytest.mark.asyncio
+    async def test_matches_buffered_encoding(self):
+        """Streamed members are encoded exactly like the buffered path"""
+        member = make_member("a")
+
+        body = await collect(_json_array(batches_of([member])))
+
+        assert body == b"[" + member.model_dump_json().encode() + b"]"
+
+    @pytest.mark.asyncio
+    async def test_batches_are_comma_separated(self):
+        """Consecutive batches are joined into one valid array"""
+        body = await collect(
+            _json_array(
+                batches_of([make_member("a"), make_member("b")], [], [make_member("c")])
+            )
+        )
+
+        assert [m["user_id"] for m in json.loads(body)] == ["a", "b", "c"]
+
+
+class TestListMembersRoute:
+    """Test the buffered and streaming member listing responses"""
+
+    @pytest.mark.asyncio
+    async def test_none_listing_returns_streaming_response(self, mock_service):
+        """A None listing switches the route to a StreamingResponse"""
+        mock_service.list_members.return_value = None
+        mock_service.stream_members = lambda org_id: batches_of([make_member("a")])
+
+        response = await list_members(
+            org_id=UUID(ORG_ID), user=User(identity="a"), service=mock_service
+        )
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/json"
+
+    def test_large_org_streams(self, client, mock_service):
+        """Streamed listings decode as a single JSON array"""
+        mock_service.list_members.return_value = None
+        mock_service.stream_members = lambda org_id: batches_of(
+            [make_member("a")], [make_member("b")]
+        )
+
+        response = client.get(f"/organizations/{ORG_ID}/members")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [member_json("a"), member_json("b")]
+
+    def test_malformed_org_id_rejected(self, client, mock_service):
+        """Non-UUID organization ids are rejected before reaching the service"""
+        response = client.get("/organizations/not-a-uuid/members")
+
+        assert response.status_code == 422
+        mock_service.list_members.assert_not_called()
+
+
+class TestAddMembersRoute:
+    """Test the bulk member endpoint"""
+
+    def test_add_members(self, client, mock_service):
+        """Valid bulk requests reach the service and return the added members"""
+        mock_service.add_members.return_value = [make_member("u1")]
+
+        response = client.post(
+            f"/organizations/{ORG_ID}/members/bulk",
+            json={"members": [{"user_id": "u1", "role": "staff"}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [member_json("u1")]
+        request = MembershipBulkCreate(
+            members=[MembershipCreate(user_id="u1", role="staff")]
+        )
+        mock_service.add_members.assert_awaited_once_with(ORG_ID, request, "admin-user")
+
+    @pytest.mark.parametrize("count", [0, MAX_BULK_MEMBERS + 1])
+    def test_member_count_bounds(self, client, mock_service, count):
+        """Empty and oversized bulk requests are rejected with 422"""
+        members = [{"user_id": f"u{i}", "role": "staff"} for i in range(count)]
+
+        response = client.post(
+            f"/organizations/{ORG_ID}/members/bulk", json={"members": members}
+        )
+
+        assert response.status_code == 422
+        mock_service.add_members.assert_not_called()
@@ -0,0 +1,40 @@
+"""Unit tests for DatabaseManager engine setup"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agent_server.core.database import DatabaseManager
+
+
+@pytest.mark.asyncio
+async def test_initialize_configures_pool(monkeypatch):
+    """Engine is created with a tuned, self-healing connection pool"""
+    monkeypatch.delenv("DATABASE_POOL_SIZE", raising=False)
+    monkeypatch.delenv("DATABASE_MAX_OVERFLOW", raising=False)
+    monkeypatch.delenv("DATABASE_POOL_RECYCLE", raising=False)
+
+    with patch("src.agent_server.core.database.create_async_engine") as mock_create:
+        await DatabaseManager().initialize()
+
+    kwargs = mock_create.call_args.kwargs
+    assert kwargs["pool_size"] == 10
+    assert kwargs["max_overflow"] == 20
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_recycle"] == 3600
+
+
+@pytest.mark.asyncio
+async def test_initialize_pool_from_env(monkeypatch):
+    """Pool sizing can be overridden through environment variables"""
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DATABASE_POOL_RECYCLE", "600")
+
+    with patch("src.agent_server.core.database.create_async_engine") as mock_create:
+        await DatabaseManager().initialize()
+
+    kwargs = mock_create.call_args.kwargs
+    assert kwargs["pool_size"] == 5
+    assert kwargs["max_overflow"] == 0
+    assert kwargs["pool_recycle"] == 600
@@ -0,0 +1,207 @@
+"""Unit tests for OrganizationCache
+
+Error handling uses a mocked client; everything else runs against fakeredis
+with Lua enabled so the generation-guarded write scripts actually execute.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+
+from agent_server.models import OrganizationView, OrganizationWithMembers
+from agent_server.services.organization_cache import OrganizationCache
+from agent_server.services.organization_service import OrganizationService
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_view(org_id: str = "org-1", role: str = "admin") -> OrganizationView:
+    return OrganizationView(
+        org_id=org_id,
+        name="Acme",
+        created_by="admin-user",
+        created_at=NOW,
+        updated_at=NOW,
+        role=role,
+    )
+
+
+@pytest.fixture(params=[(6,), (7,)], ids=["redis6", "redis7"])
+def redis(request):
+    """In-process Redis that executes the cache's Lua scripts for real"""
+    return FakeAsyncRedis(decode_responses=True, version=request.param)
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client for testing"""
+    return AsyncMock()
+
+
+class TestOrganizationCache:
+    """Test organization response caching"""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_client(self):
+        """A cache without a client is a no-op"""
+        cache = OrganizationCache(None)
+
+        assert not cache.enabled
+        assert await cache.get_organizations("user") is None
+        await cache.set_organizations("user", [make_view()], "0")
+        await cache.invalidate("org-1", ["user"])
+
+    @pytest.mark.asyncio
+    async def test_organizations_round_trip(self, redis):
+        """Listings are stored per user and decoded on read"""
+        cache = OrganizationCache(redis, ttl=30)
+        views = [make_view()]
+
+        generation = await cache.list_generation("user")
+        await cache.set_organizations("user", views, generation)
+
+        assert await redis.keys() == ["org:list:user"]
+        assert 0 < await redis.ttl("org:list:user") <= 30
+        assert await cache.get_organizations("user") == views
+
+    @pytest.mark.asyncio
+    async def test_set_organizations_after_invalidate_is_dropped(self, redis):
+        """A listing loaded before an invalidation is not written back"""
+        cache = OrganizationCache(redis)
+
+        generation = await cache.list_generation("user")
+        await cache.invalidate(user_ids=["user"])
+        await cache.set_organizations("user", [make_view()], generation)
+
+        assert await cache.get_organizations("user") is None
+
+    @pytest.mark.asyncio
+    async def test_read_error_is_a_miss(self, mock_redis):
+        """Redis failures fall through to the database"""
+        mock_redis.get.side_effect = RedisError("down")
+        cache = OrganizationCache(mock_redis)
+
+        assert await cache.get_organizations("user") is None
+        assert await cache.get_organization("org-1") is None
+        assert await cache.generation("org-1") == "0"
+        assert await cache.list_generation("user") == "0"
+
+    @pytest.mark.asyncio
+    async def test_organization_shared_payload(self, redis):
+        """Details are stored once per organization, not once per member"""
+        cache = OrganizationCache(redis)
+        organization = OrganizationWithMembers(
+            org_id="org-1",
+            name="Acme",
+            created_by="admin-user",
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+        generation = await cache.generation("org-1")
+        await cache.set_organization("org-1", organization, generation)
+
+        assert await redis.keys() == ["org:detail:org-1"]
+        assert 0 < await redis.ttl("org:detail:org-1") <= cache.ttl
+        assert await cache.get_organization("org-1") == organization
+
+    @pytest.mark.asyncio
+    async def test_set_organization_after_invalidate_is_dropped(self, redis):
+        """A detail loaded before an invalidation is not written back"""
+        cache = OrganizationCache(redis)
+        organization = MagicMock()
+        organization.model_dump_json.return_value = "{}"
+
+        generation = await cache.generation("org-1")
+        await cache.invalidate("org-1", ["user"])
+        await cache.set_organization("org-1", organization, generation)
+
+        assert await cache.get_organization("org-1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, redis):
+        """Invalidation drops the org keys and listings and bumps the generations"""
+        await redis.set("org:list:a", "[]")
+        await redis.set("org:list:b", "[]")
+        await redis.set("org:detail:org-1", "{}")
+        await redis.hset("org_roles:org-1", "a", "admin")
+        cache = OrganizationCache(redis)
+
+        await cache.invalidate("org-1", ["a", "b"])
+
+        assert sorted(await redis.keys()) == [
+            "org:gen:org-1",
+            "org:list_gen:a",
+            "org:list_gen:b",
+        ]
+        assert await cache.generation("org-1") == "1"
+        assert await cache.list_generation("a") == "1"
+        assert await redis.ttl("org:gen:org-1") > 0
+        assert await redis.ttl("org:list_gen:a") > 0
+
+    @pytest.mark.asyncio
+    async def test_role_round_trip(self, redis):
+        """Roles written at the current generation are served back"""
+        cache = OrganizationCache(redis, role_ttl=10)
+
+        generation = await cache.generation("org-1")
+        await cache.set_role("org-1", "user", "admin", generation)
+
+        assert await cache.get_role("org-1", "user") == "admin"
+        assert 0 < await redis.ttl("org_roles:org-1") <= 10
+
+    @pytest.mark.asyncio
+    async def test_role_ttl_not_extended(self, redis):
+        """EXPIRE NX keeps the first deadline as more roles are added"""
+        cache = OrganizationCache(redis, role_ttl=10)
+        await cache.set_role("org-1", "a", "admin", "0")
+        await redis.expire("org_roles:org-1", 3)
+
+        await cache.set_role("org-1", "b", "admin", "0")
+
+        assert await redis.ttl("org_roles:org-1") <= 3
+
+    @pytest.mark.asyncio
+    async def test_set_role_after_invalidate_is_dropped(self, redis):
+        """A role loaded before an invalidation is not written back"""
+        cache = OrganizationCache(redis)
+
+        generation = await cache.generation("org-1")
+        await cache.invalidate("org-1", ["user"])
+        await cache.set_role("org-1", "user", "admin", generation)
+
+        assert await cache.get_role("org-1", "user") is None
+
+
+class TestGenerationGuard:
+    """Test that service writes cannot follow a concurrent invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_demoted_admin_role_is_not_cached(self, redis):
+        """Invalidating between the admin query and set_role leaves no role"""
+        cache = OrganizationCache(redis)
+        session = AsyncMock()
+
+        async def admin_check_then_demoted(_stmt):
+            # Another request demotes the user after the DB answered
+            await cache.invalidate("org-1", ["admin-user"])
+            return True
+
+        session.scalar.side_effect = admin_check_then_demoted
+        session.execute.return_value = MagicMock(rowcount=1)
+        service = OrganizationService(session, cache)
+
+        await service.remove_member("org-1", "staff-user", "admin-user")
+
+        assert await cache.get_role("org-1", "admin-user") is None
+
+        # The next admin check goes back to the database
+        session.scalar.side_effect = None
+        session.scalar.return_value = False
+        with pytest.raises(HTTPException) as exc_info:
+            await service.remove_member("org-1", "staff-user", "admin-user")
+        assert exc_info.value.status_code == 403
@@ -0,0 +1,662 @@
+"""Unit tests for OrganizationService business logic
+
+The database session is mocked; ORM instances are built in memory.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from agent_server.core.orm import Organization as OrganizationORM
+from agent_server.core.orm import OrganizationMember as OrganizationMemberORM
+from agent_server.models import (
+    MembershipBulkCreate,
+    MembershipCreate,
+    MembershipUpdate,
+    OrganizationCreate,
+    OrganizationWithMembers,
+)
+from agent_server.services.organization_cache import OrganizationCache
+from agent_server.services.organization_service import (
+    BULK_INSERT_CHUNK_SIZE,
+    MEMBER_STREAM_THRESHOLD,
+    OrganizationService,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_member(
+    org_id: str, user_id: str, role: str = "staff"
+) -> OrganizationMemberORM:
+    return OrganizationMemberORM(
+        org_id=org_id,
+        user_id=user_id,
+        role=role,
+        invited_by="admin-user",
+        created_at=NOW,
+    )
+
+
+def make_org(org_id: str = "org-1", members: list | None = None) -> OrganizationORM:
+    return OrganizationORM(
+        org_id=org_id,
+        name="Acme",
+        created_by="admin-user",
+        created_at=NOW,
+        updated_at=NOW,
+        members=members or [],
+    )
+
+
+def org_row(org_id: str) -> dict:
+    return {
+        "org_id": org_id,
+        "name": "Acme",
+        "created_by": "admin-user",
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def scalars_result(rows: list) -> Mock:
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
+@pytest.fixture
+def mock_session():
+    """Mock AsyncSession for testing"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def organization_service(mock_session):
+    """OrganizationService instance with a mocked session"""
+    return OrganizationService(mock_session)
+
+
+class TestGetOrganization:
+    """Test organization lookup with eagerly loaded members"""
+
+    @pytest.mark.asyncio
+    async def test_get_organization_single_query(
+        self, organization_service, mock_session
+    ):
+        """Organization and members come back from one round-trip"""
+        org = make_org(
+            members=[
+                make_member("org-1", "admin-user", "admin"),
+                make_member("org-1", "staff-user"),
+            ]
+        )
+        mock_session.scalar.return_value = org
+
+        result = await organization_service.get_organization("org-1", "staff-user")
+
+        assert result.org_id == "org-1"
+        assert {m.user_id for m in result.members} == {"admin-user", "staff-user"}
+        mock_session.scalar.assert_awaited_once()
+        mock_session.get.assert_not_called()
+        mock_session.scalars.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_organization_matches_validated_model(
+        self, organization_service, mock_session
+    ):
+        """Constructed response serializes the same as a validated one"""
+        mock_session.scalar.return_value = make_org(
+            members=[make_member("org-1", "admin-user", "admin")]
+        )
+
+        result = await organization_service.get_organization("org-1", "admin-user")
+
+        assert (
+            result.model_dump()
+            == OrganizationWithMembers.model_validate(result.model_dump()).model_dump()
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_organization_not_member(
+        self, organization_service, mock_session
+    ):
+        """Non-members are rejected"""
+        mock_session.scalar.return_value = make_org(
+            members=[make_member("org-1", "admin-user", "admin")]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.get_organization("org-1", "outsider")
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_get_organization_missing(self, organization_service, mock_session):
+        """Missing organizations look the same as ones the caller cannot see"""
+        mock_session.scalar.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.get_organization("missing", "user")
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_list_members(self, organization_service, mock_session):
+        """Small organizations are returned as a buffered list"""
+        mock_session.execute.return_value = Mock(one=Mock(return_value=(2, True)))
+        mock_session.scalars.return_value = scalars_result(
+            [
+                make_member("org-1", "admin-user", "admin"),
+                make_member("org-1", "staff-user"),
+            ]
+        )
+
+        result = await organization_service.list_members("org-1", "admin-user")
+
+        assert [m.user_id for m in result] == ["admin-user", "staff-user"]
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_list_members_large_org_streams(
+        self, organization_service, mock_session
+    ):
+        """Organizations above the threshold signal the caller to stream"""
+        mock_session.execute.return_value = Mock(
+            one=Mock(return_value=(MEMBER_STREAM_THRESHOLD + 1, True))
+        )
+
+        assert await organization_service.list_members("org-1", "admin-user") is None
+        mock_session.scalars.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_members_not_member(self, organization_service, mock_session):
+        """Non-members are rejected before any rows are loaded"""
+        mock_session.execute.return_value = Mock(one=Mock(return_value=(3, False)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.list_members("org-1", "outsider")
+
+        assert exc_info.value.status_code == 403
+        mock_session.scalars.assert_not_called()
+
+
+class TestStreamMembers:
+    """Test batched member streaming on a dedicated session"""
+
+    @pytest.mark.asyncio
+    async def test_stream_members_yields_batches(self, organization_service):
+        """Each cursor partition becomes one batch of member models"""
+
+        async def partitions():
+            yield [make_member("org-1", "a"), make_member("org-1", "b")]
+            yield [make_member("org-1", "c")]
+
+        session = AsyncMock()
+        session.stream_scalars.return_value = Mock(partitions=partitions)
+        maker = Mock(return_value=AsyncMock())
+        maker.return_value.__aenter__.return_value = session
+
+        with patch(
+            "agent_server.services.organization_service._get_session_maker",
+            return_value=maker,
+        ):
+            batches = [
+                [m.user_id for m in batch]
+                async for batch in organization_service.stream_members("org-1")
+            ]
+
+        assert batches == [["a", "b"], ["c"]]
+        # The request-scoped session is not used once the response streams
+        organization_service.session.stream_scalars.assert_not_called()
+
+
+class TestListOrganizations:
+    """Test listing the caller's organizations"""
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_single_join(
+        self, organization_service, mock_session
+    ):
+        """Organizations and roles come back from one joined query"""
+        result_proxy = Mock()
+        result_proxy.mappings.return_value = [
+            {**org_row("org-1"), "role": "admin"},
+            {**org_row("org-2"), "role": "staff"},
+        ]
+        mock_session.execute.return_value = result_proxy
+
+        result = await organization_service.list_organizations("user")
+
+        assert [(o.org_id, o.role) for o in result] == [
+            ("org-1", "admin"),
+            ("org-2", "staff"),
+        ]
+        mock_session.execute.assert_awaited_once()
+        mock_session.scalars.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_empty(self, organization_service, mock_session):
+        """Users without memberships get an empty list"""
+        result_proxy = Mock()
+        result_proxy.mappings.return_value = []
+        mock_session.execute.return_value = result_proxy
+
+        assert await organization_service.list_organizations("user") == []
+
+
+class TestCreateOrganization:
+    """Test organization creation"""
+
+    @pytest.mark.asyncio
+    async def test_create_organization_uses_returning(
+        self, organization_service, mock_session
+    ):
+        """Created rows come back from INSERT ... RETURNING without refreshes"""
+        org = make_org()
+        membership = make_member("org-1", "admin-user", "admin")
+        mock_session.scalar.return_value = org
+        mock_session.execute.return_value.scalar_one = Mock(return_value=membership)
+
+        result = await organization_service.create_organization(
+            OrganizationCreate(name="Acme"), "admin-user"
+        )
+
+        assert result.org_id == "org-1"
+        assert result.created_at == NOW
+        assert [(m.user_id, m.role) for m in result.members] == [
+            ("admin-user", "admin")
+        ]
+        mock_session.commit.assert_awaited_once()
+        mock_session.refresh.assert_not_called()
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_organization_name_taken(
+        self, organization_service, mock_session
+    ):
+        """A name conflict skips the insert and returns 409"""
+        mock_session.scalar.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.create_organization(
+                OrganizationCreate(name="Acme"), "admin-user"
+            )
+
+        assert exc_info.value.status_code == 409
+        mock_session.scalar.assert_awaited_once()
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+
+class TestUpdateMember:
+    """Test membership role updates"""
+
+    @pytest.mark.asyncio
+    async def test_update_member_success(self, organization_service, mock_session):
+        """Updated row is returned by UPDATE ... RETURNING"""
+        mock_session.scalar.side_effect = [
+            True,
+            make_member("org-1", "staff-user", "admin"),
+        ]
+
+        result = await organization_service.update_member(
+            "org-1", "staff-user", MembershipUpdate(role="admin"), "admin-user"
+        )
+
+        assert result.role == "admin"
+        mock_session.commit.assert_awaited_once()
+        mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_member_not_found(self, organization_service, mock_session):
+        """Updating a missing member returns 404"""
+        mock_session.scalar.side_effect = [True, None]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.update_member(
+                "org-1", "ghost", MembershipUpdate(role="admin"), "admin-user"
+            )
+
+        assert exc_info.value.status_code == 404
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_member_requires_admin(
+        self, organization_service, mock_session
+    ):
+        """Non-admins cannot change roles"""
+        mock_session.scalar.return_value = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.update_member(
+                "org-1", "staff-user", MembershipUpdate(role="admin"), "staff-user"
+            )
+
+        assert exc_info.value.status_code == 403
+
+
+class TestAddMember:
+    """Test adding members"""
+
+    @pytest.mark.asyncio
+    async def test_add_member_success(self, organization_service, mock_session):
+        """Member is inserted with ON CONFLICT DO NOTHING ... RETURNING"""
+        mock_session.scalar.side_effect = [True, make_member("org-1", "new-user")]
+
+        result = await organization_service.add_member(
+            "org-1", MembershipCreate(user_id="new-user", role="staff"), "admin-user"
+        )
+
+        assert result.user_id == "new-user"
+        assert mock_session.scalar.await_count == 2
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_add_member_already_present(self, organization_service, mock_session):
+        """A conflicting insert returns no row and maps to 409"""
+        mock_session.scalar.side_effect = [True, None]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.add_member(
+                "org-1",
+                MembershipCreate(user_id="new-user", role="staff"),
+                "admin-user",
+            )
+
+        assert exc_info.value.status_code == 409
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_member_requires_admin(self, organization_service, mock_session):
+        """Non-admins cannot add members"""
+        mock_session.scalar.return_value = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.add_member(
+                "org-1",
+                MembershipCreate(user_id="new-user", role="staff"),
+                "staff-user",
+            )
+
+        assert exc_info.value.status_code == 403
+        mock_session.scalar.assert_awaited_once()
+        mock_session.commit.assert_not_called()
+
+
+class TestAddMembers:
+    """Test bulk member addition"""
+
+    @pytest.mark.asyncio
+    async def test_add_members_batches_inserts(
+        self, organization_service, mock_session
+    ):
+        """Members are inserted in chunks with a single commit"""
+        mock_session.scalar.return_value = True
+        mock_session.scalars.side_effect = [
+            scalars_result([make_member("org-1", "u0")]),
+            scalars_result([make_member("org-1", "u-last")]),
+        ]
+        request = MembershipBulkCreate(
+            members=[
+                MembershipCreate(user_id=f"u{i}", role="staff")
+                for i in range(BULK_INSERT_CHUNK_SIZE + 1)
+            ]
+        )
+
+        result = await organization_service.add_members("org-1", request, "admin-user")
+
+        assert [m.user_id for m in result] == ["u0", "u-last"]
+        assert mock_session.scalars.await_count == 2
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_add_members_requires_admin(self, organization_service, mock_session):
+        """Non-admins cannot add members in bulk"""
+        mock_session.scalar.return_value = False
+        request = MembershipBulkCreate(
+            members=[MembershipCreate(user_id="u1", role="staff")]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.add_members("org-1", request, "staff-user")
+
+        assert exc_info.value.status_code == 403
+        mock_session.scalars.assert_not_called()
+
+
+class TestRemoveMember:
+    """Test removing members"""
+
+    @pytest.mark.asyncio
+    async def test_remove_member_bulk_delete(self, organization_service, mock_session):
+        """Membership is removed with a DELETE statement, not an ORM delete"""
+        mock_session.scalar.return_value = True
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await organization_service.remove_member("org-1", "staff-user", "admin-user")
+
+        mock_session.execute.assert_awaited_once()
+        mock_session.delete.assert_not_called()
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_remove_member_not_found(self, organization_service, mock_session):
+        """Removing a missing member returns 404"""
+        mock_session.scalar.return_value = True
+        mock_session.execute.return_value = Mock(rowcount=0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.remove_member("org-1", "ghost", "admin-user")
+
+        assert exc_info.value.status_code == 404
+        mock_session.commit.assert_not_called()
+
+
+class TestDeleteOrganization:
+    """Test organization deletion"""
+
+    @pytest.mark.asyncio
+    async def test_delete_organization(self, organization_service, mock_session):
+        """Organization is removed with a single DELETE after the admin check"""
+        mock_session.scalar.return_value = True
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await organization_service.delete_organization("org-1", "admin-user")
+
+        mock_session.get.assert_not_called()
+        mock_session.delete.assert_not_called()
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_organization_requires_admin(
+        self, organization_service, mock_session
+    ):
+        """Non-admins cannot delete the organization"""
+        mock_session.scalar.return_value = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await organization_service.delete_organization("org-1", "outsider")
+
+        assert exc_info.value.status_code == 403
+        mock_session.execute.assert_not_called()
+
+
+class TestResponseCache:
+    """Test cache lookups and invalidation around service calls"""
+
+    @pytest.fixture
+    def mock_cache(self):
+        cache = AsyncMock(spec=OrganizationCache)
+        cache.enabled = True
+        cache.get_organizations.return_value = None
+        cache.get_organization.return_value = None
+        cache.get_role.return_value = None
+        return cache
+
+    @pytest.fixture
+    def cached_service(self, mock_session, mock_cache):
+        return OrganizationService(mock_session, mock_cache)
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_cache_hit(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Cached listings skip the database"""
+        mock_cache.get_organizations.return_value = []
+
+        assert await cached_service.list_organizations("user") == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_organizations_populates_cache(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Listing misses are cached under the generation read before the query"""
+        result_proxy = Mock()
+        result_proxy.mappings.return_value = []
+        mock_session.execute.return_value = result_proxy
+
+        await cached_service.list_organizations("user")
+
+        mock_cache.list_generation.assert_awaited_once_with("user")
+        mock_cache.set_organizations.assert_awaited_once_with(
+            "user", [], mock_cache.list_generation.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_organization_populates_cache(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Misses are loaded from the database and cached as one shared payload"""
+        mock_session.scalar.return_value = make_org(
+            members=[make_member("org-1", "admin-user", "admin")]
+        )
+
+        result = await cached_service.get_organization("org-1", "admin-user")
+
+        mock_cache.set_organization.assert_awaited_once_with(
+            "org-1", result, mock_cache.generation.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_organization_skips_caching_large_orgs(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Organizations above the stream threshold are never cached"""
+        members = [
+            make_member("org-1", f"u{i}") for i in range(MEMBER_STREAM_THRESHOLD)
+        ]
+        members.append(make_member("org-1", "admin-user", "admin"))
+        mock_session.scalar.return_value = make_org(members=members)
+
+        await cached_service.get_organization("org-1", "admin-user")
+
+        mock_cache.set_organization.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_detail_requires_membership(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """The shared cached detail is only served to its members"""
+        mock_cache.get_organization.return_value = Mock(
+            members=[Mock(user_id="admin-user")]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cached_service.get_organization("org-1", "outsider")
+
+        assert exc_info.value.status_code == 403
+        mock_session.scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_members_uses_cached_detail(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Member listings are served from the cached organization detail"""
+        member = Mock(user_id="user")
+        mock_cache.get_organization.return_value = Mock(members=[member])
+
+        assert await cached_service.list_members("org-1", "user") == [member]
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_members_cached_large_org_streams(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """A cached detail above the threshold still falls back to streaming"""
+        members = [Mock(user_id=f"u{i}") for i in range(MEMBER_STREAM_THRESHOLD)]
+        members.append(Mock(user_id="user"))
+        mock_cache.get_organization.return_value = Mock(members=members)
+
+        assert await cached_service.list_members("org-1", "user") is None
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_admin_check_uses_cached_role(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """A cached admin role skips the membership query"""
+        mock_cache.get_role.return_value = "admin"
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await cached_service.remove_member("org-1", "staff-user", "admin-user")
+
+        mock_session.scalar.assert_not_called()
+        mock_cache.set_role.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_admin_check_caches_role_on_miss(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Admin roles confirmed by the database are written back to the cache"""
+        mock_session.scalar.return_value = True
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await cached_service.remove_member("org-1", "staff-user", "admin-user")
+
+        mock_cache.set_role.assert_awaited_once_with(
+            "org-1", "admin-user", "admin", mock_cache.generation.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_admin_check_does_not_cache_non_admins(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Failed admin checks leave the role cache untouched"""
+        mock_session.scalar.return_value = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cached_service.delete_organization("org-1", "staff-user")
+
+        assert exc_info.value.status_code == 403
+        mock_cache.set_role.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remove_member_invalidates(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Mutations drop the organization and the affected user's listing"""
+        mock_session.scalar.return_value = True
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await cached_service.remove_member("org-1", "staff-user", "admin-user")
+
+        mock_cache.invalidate.assert_awaited_once_with("org-1", ["staff-user"])
+
+    @pytest.mark.asyncio
+    async def test_delete_organization_invalidates_all_members(
+        self, cached_service, mock_session, mock_cache
+    ):
+        """Deleting an organization invalidates every member's listing"""
+        mock_session.scalar.return_value = True
+        mock_session.scalars.return_value = ["admin-user", "staff-user"]
+        mock_session.execute.return_value = Mock(rowcount=1)
+
+        await cached_service.delete_organization("org-1", "admin-user")
+
+        mock_cache.invalidate.assert_awaited_once_with(
+            "org-1", ["admin-user", "staff-user"]
+        )
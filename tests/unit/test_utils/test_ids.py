@@ -0,0 +1,33 @@
+"""Unit tests for identifier helpers"""
+
+import time
+from uuid import RFC_4122
+
+from src.agent_server.utils.ids import uuid7
+
+
+class TestUuid7:
+    """Test uuid7 function"""
+
+    def test_version_and_variant(self):
+        """Generated ids are RFC 4122 version 7 UUIDs"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == RFC_4122
+
+    def test_embeds_current_timestamp(self):
+        """The leading 48 bits hold the creation time in milliseconds"""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_time_ordered(self):
+        """Ids from later milliseconds sort after earlier ones"""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert str(first) < str(second)